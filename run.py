@@ -1,18 +1,13 @@
 import json
+import time
 from concurrent.futures import ProcessPoolExecutor, wait, ALL_COMPLETED
 from itertools import product
 
-import numpy as np
-import pandas as pd
-import psopy
-import scipy.optimize as scopt
-
 from src import config, arguments
-from src.plot import plot
-from src.utils.goal_function import goal_function
 
 
 def main():
+    start_time = time.perf_counter()
     args = arguments.parser.parse_args()
 
     models_args = args.models
@@ -20,11 +15,41 @@ def main():
     file_path = args.input[0]
     attempts = args.attempts[0]
     output = args.output[0]
+    no_plot = args.no_plot
+    loss_name = args.loss[0]
+    loss_scale = args.loss_scale[0]
+    weighting = args.weighting[0]
+    resampling = args.resampling[0]
+    replicates = args.replicates[0]
+    by_group = args.resample_by[0] == 'group'
+    refit_tol = args.refit_tol[0]
+
+    import numpy as np
+    import pandas as pd
+    from src.utils.goal_function import goal_function, goal_function_gradient, condition_weights
+    from src.utils.loss_functions import get_loss
+
+    if 'PSO' in methods:
+        import psopy
+    if any(method != 'PSO' for method in methods):
+        import scipy.optimize as scopt
+    if not no_plot:
+        from src.plot import plot
+    if resampling == 'bootstrap':
+        from src.uncertainty.bootstrap_analysis import BootstrapAnalysis
+    elif resampling == 'jackknife':
+        from src.uncertainty.jackknife_analysis import JackknifeAnalysis
+
+    imports_time = time.perf_counter()
+    print('Startup and imports took {:.3f}s'.format(imports_time - start_time))
 
     df = pd.read_csv(file_path, decimal=',')
+    loss = get_loss(loss_name, loss_scale)
+    weights = condition_weights(df) if weighting == 'condition' else None
 
-    models = [v for k, v in config.ALLOWED_MODELS.items() if k in models_args]
+    models = [config.get_model(k) for k in config.ALLOWED_MODELS.keys() if k in models_args]
     results_map = dict(((cls, method), []) for cls, method in product(models, methods))
+    print('Data loading took {:.3f}s'.format(time.perf_counter() - imports_time))
     executor = ProcessPoolExecutor()
 
     result_dict = {}
@@ -36,7 +61,7 @@ def main():
                 fn=psopy.minimize,
                 fun=goal_function,
                 x0=params,
-                args=(df.copy(), cls),
+                args=(df, cls, loss, weights),
                 tol=2.5e-3
             )
             results_map[(cls, method)].append(future_result)
@@ -47,8 +72,9 @@ def main():
                     fn=scopt.minimize,
                     fun=goal_function,
                     x0=params,
-                    args=(df.copy(), cls),
+                    args=(df, cls, loss, weights),
                     method=method,
+                    jac=goal_function_gradient if method in config.GRADIENT_METHODS else None,
                     tol=2.5e-3
                 )
                 results_map[(cls, method)].append(future_result)
@@ -65,16 +91,43 @@ def main():
             def result_mapper(result):
                 model = cls(result.x)
                 fitness = result.fun
+                deviation = goal_function(result.x, df, cls)
                 return {
                     'params': model.json,
                     'fitness': fitness,
-                    'deviation_percentage': 100.0 * (fitness ** 0.5),
+                    'deviation_percentage': 100.0 * (deviation ** 0.5),
                     'method': method
                 }
 
-            best_result = results[0].x
-            plot(df, cls(best_result), '{}_{}.png'.format(method, cls.__name__))
+            if not no_plot:
+                best_result = results[0].x
+                plot(df, cls(best_result), '{}_{}.png'.format(method, cls.__name__))
             method_dict[method] = [result_mapper(r) for r in results]
+
+            if resampling != 'none':
+                print('Running {} of {} solution for model {}'.format(resampling, method, cls.__name__))
+                resampling_kwargs = {
+                    'method': 'Nelder-Mead' if method == 'PSO' else method,
+                    'by_group': by_group,
+                    'loss': loss,
+                    'weights': weights,
+                    'tol': refit_tol
+                }
+                if resampling == 'bootstrap':
+                    analysis = BootstrapAnalysis(results[0].x, cls, replicates=replicates, **resampling_kwargs)
+                else:
+                    analysis = JackknifeAnalysis(results[0].x, cls, **resampling_kwargs)
+                best_result_dict = method_dict[method][0]
+                best_result_dict['confidence_intervals'] = None
+                best_result_dict['dropped_replicates'] = None
+                try:
+                    analysis.run(df, executor, '{}_{}_{}.csv'.format(method, cls.__name__, resampling))
+                    best_result_dict['refined_params'] = cls(analysis.estimate).json
+                    best_result_dict['dropped_replicates'] = analysis.dropped_replicates
+                    best_result_dict['confidence_intervals'] = analysis.confidence_intervals()
+                except (RuntimeError, ValueError) as error:
+                    print('Could not estimate confidence intervals of {} solution for model {}: {}'.format(
+                        method, cls.__name__, error))
         result_dict[cls.__name__] = method_dict
 
     with open(output, 'w') as output:
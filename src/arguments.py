@@ -1,6 +1,20 @@
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
+
+from src.config import ALLOWED_LOSSES, ALLOWED_METHODS, ALLOWED_MODELS, ALLOWED_RESAMPLINGS, ALLOWED_WEIGHTINGS
+
+def positive_float(value: str):
+    number = float(value)
+    if not number > 0.0:
+        raise ArgumentTypeError("{} is not a positive number".format(value))
+    return number
+
+
+def replicates_number(value: str):
+    number = int(value)
+    if number < 2:
+        raise ArgumentTypeError("at least 2 replicates are required, got {}".format(value))
+    return number
 
-from src.config import ALLOWED_METHODS, ALLOWED_MODELS
 
 parser = ArgumentParser(
     description='Material model parameters identification tool'
@@ -14,3 +28,20 @@ parser.add_argument('--attempts', nargs=1, type=int, metavar="[1-100]", choices=
                     help='Maximum number of attempts per single model-method pair', default=10)
 parser.add_argument('--input', nargs=1, help='Path to CSV file with input data')
 parser.add_argument('--output', nargs=1, help='Path to JSON for output data')
+parser.add_argument('--no-plot', action='store_true',
+                    help='Skip plotting of the best solution for each model-method pair')
+parser.add_argument('--loss', nargs=1, choices=ALLOWED_LOSSES, default=['relative-L2'],
+                    help='Loss function used to compare computed and measured stresses')
+parser.add_argument('--loss-scale', nargs=1, type=positive_float, default=[0.05],
+                    help='Relative residual at which huber and cauchy losses start to down-weight points; '
+                         'ignored by relative-L2 and absolute-L2')
+parser.add_argument('--weighting', nargs=1, choices=ALLOWED_WEIGHTINGS, default=['none'],
+                    help='Weighting of data points; "condition" balances (strain rate, temperature) groups')
+parser.add_argument('--resampling', nargs=1, choices=ALLOWED_RESAMPLINGS, default=['none'],
+                    help='Resampling method used to estimate confidence intervals of the best solution')
+parser.add_argument('--replicates', nargs=1, type=replicates_number, default=[1000],
+                    help='Number of bootstrap replicates')
+parser.add_argument('--resample-by', nargs=1, choices=['point', 'group'], default=['point'],
+                    help='Resample single data points or whole (strain rate, temperature) groups')
+parser.add_argument('--refit-tol', nargs=1, type=positive_float, default=[1e-8],
+                    help='Optimizer tolerance used to polish the best solution and refit resampling replicates')
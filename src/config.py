@@ -1,15 +1,11 @@
-from src.models.johnson_cook_model import JohnsonCookModel
-from src.models.khan_huang_liang_model import KhanHuangLiangModel
-from src.models.modified_johnson_cook_model import ModifiedJohnsonCookModel
-from src.models.zerilli_armstrong_bcc_model import ZerilliArmstrongBCCModel
-from src.models.zerilli_armstrong_fcc_model import ZerilliArmstrongFCCModel
+from importlib import import_module
 
 ALLOWED_MODELS = {
-    'JC': JohnsonCookModel,
-    'MJC': ModifiedJohnsonCookModel,
-    'ZA-FCC': ZerilliArmstrongFCCModel,
-    'ZA-BCC': ZerilliArmstrongBCCModel,
-    'KHL': KhanHuangLiangModel
+    'JC': 'src.models.johnson_cook_model.JohnsonCookModel',
+    'MJC': 'src.models.modified_johnson_cook_model.ModifiedJohnsonCookModel',
+    'ZA-FCC': 'src.models.zerilli_armstrong_fcc_model.ZerilliArmstrongFCCModel',
+    'ZA-BCC': 'src.models.zerilli_armstrong_bcc_model.ZerilliArmstrongBCCModel',
+    'KHL': 'src.models.khan_huang_liang_model.KhanHuangLiangModel'
 }
 
 ALLOWED_METHODS = [
@@ -19,4 +15,45 @@ ALLOWED_METHODS = [
     'PSO'
 ]
 
+GRADIENT_METHODS = [
+    'BFGS'
+]
+
+ALLOWED_LOSSES = [
+    'relative-L2',
+    'absolute-L2',
+    'huber',
+    'cauchy'
+]
+
+ALLOWED_WEIGHTINGS = [
+    'none',
+    'condition'
+]
+
+ALLOWED_RESAMPLINGS = [
+    'none',
+    'bootstrap',
+    'jackknife'
+]
+
 MAX_RESULTS = 5
+
+_resolved_models = {}
+
+
+def get_model(name: str):
+    if name not in ALLOWED_MODELS:
+        raise ValueError("Unknown model: {}".format(name))
+    if name not in _resolved_models:
+        module_path, class_name = ALLOWED_MODELS[name].rsplit('.', 1)
+        _resolved_models[name] = getattr(import_module(module_path), class_name)
+    return _resolved_models[name]
+
+
+def get_model_name(cls) -> str:
+    path = '{}.{}'.format(cls.__module__, cls.__name__)
+    for name, model_path in ALLOWED_MODELS.items():
+        if model_path == path:
+            return name
+    return cls.__name__
@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 
 from src.models.material_model import MaterialModel
@@ -38,4 +36,4 @@ class JohnsonCookModel(MaterialModel):
         C = parameters[3]
         m = parameters[4]
 
-        return (A + B * (strain ** n)) * (1 + C * math.log(r_h)) * (1 - (t_h ** m))
\ No newline at end of file
+        return (A + B * (strain ** n)) * (1 + C * np.log(r_h)) * (1 - (t_h ** m))
\ No newline at end of file
@@ -1,4 +1,3 @@
-import math
 import numpy as np
 
 from src.models.material_model import MaterialModel
@@ -29,7 +28,7 @@ class KhanHuangLiangModel(MaterialModel):
         t_melt = 1425 + 273.15
         t_h = (temperature - t_ref) / (t_melt - t_ref)
         D0 = 1e6
-        D_log = math.log(D0)
+        D_log = np.log(D0)
 
         A = parameters[0]
         B = parameters[1]
@@ -40,7 +39,7 @@ class KhanHuangLiangModel(MaterialModel):
 
         rate_exp = strain_rate ** C
         softening = (1 - t_h ** m)
-        hardening = ((1 - (math.log(strain_rate) / D_log)) ** n1) * (strain ** n0)
+        hardening = ((1 - (np.log(strain_rate) / D_log)) ** n1) * (strain ** n0)
 
         return (A + B * hardening) * softening * rate_exp
 
@@ -52,7 +51,7 @@ class KhanHuangLiangModel(MaterialModel):
         t_melt = 1425 + 273.15
         t_h = (temperature - t_ref) / (t_melt - t_ref)
         D0 = 1e6
-        D_log = math.log(D0)
+        D_log = np.log(D0)
 
         A = parameters[0]
         B = parameters[1]
@@ -61,23 +60,23 @@ class KhanHuangLiangModel(MaterialModel):
         C = parameters[4]
         m = parameters[5]
 
-        s_safe = max(strain, 1e-9)
-        sr_safe = max(strain_rate, 1e-9)
-        th_safe = max(t_h, 1e-9)
+        s_safe = np.maximum(strain, 1e-9)
+        sr_safe = np.maximum(strain_rate, 1e-9)
+        th_safe = np.maximum(t_h, 1e-9)
 
         rate_exp = strain_rate ** C
         softening = (1 - t_h ** m)
-        ln_diff = (1 - (math.log(sr_safe) / D_log))
+        ln_diff = (1 - (np.log(sr_safe) / D_log))
         hardening = (ln_diff ** n1) * (strain ** n0)
         full_strain_hardening = (A + B * hardening)
 
         derivatives = {
             labels[0]: rate_exp * softening,
             labels[1]: rate_exp * softening * hardening,
-            labels[2]: B * hardening * math.log(s_safe) * softening * rate_exp,
-            labels[3]: B * (ln_diff ** n1) * math.log(ln_diff) * softening * rate_exp,
-            labels[4]: full_strain_hardening * softening * rate_exp * math.log(sr_safe),
-            labels[5]: - full_strain_hardening * rate_exp * (t_h ** m) * math.log(th_safe)
+            labels[2]: B * hardening * np.log(s_safe) * softening * rate_exp,
+            labels[3]: B * hardening * np.log(ln_diff) * softening * rate_exp,
+            labels[4]: full_strain_hardening * softening * rate_exp * np.log(sr_safe),
+            labels[5]: - full_strain_hardening * rate_exp * (t_h ** m) * np.log(th_safe)
         }
 
         return derivatives
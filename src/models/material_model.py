@@ -29,6 +29,10 @@ class MaterialModel(abc.ABC):
     def _lower_bounds(cls):
         return np.ones_like(cls.params_scaling()) * (-np.inf)
 
+    @classmethod
+    def bounds(cls):
+        return cls._lower_bounds(), cls._upper_bounds()
+
     def is_within_bounds(self):
         params: np.ndarray = self.params
         upper: np.ndarray = self._upper_bounds()
@@ -72,3 +76,8 @@ class MaterialModel(abc.ABC):
             derivative = (forward_model(*args) - backward_model(*args)) / distance
             derivatives[key] = derivative
         return derivatives
+
+    def jacobian(self, strain: np.ndarray, strain_rate: np.ndarray, temperature: np.ndarray):
+        derivatives = self.derivatives(strain, strain_rate, temperature)
+        shape = np.shape(strain)
+        return np.column_stack([np.broadcast_to(derivatives[label], shape) for label in self.labels()])
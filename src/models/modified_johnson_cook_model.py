@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 
 from src.models.material_model import MaterialModel
@@ -39,7 +37,7 @@ class ModifiedJohnsonCookModel(MaterialModel):
         str_rate_dep = b1 + strain * (b2 + strain * b3)
         temp_dep = L1 + L2 * strain
 
-        return (A1 * (strain ** n1)) * (1 + str_rate_dep * math.log(r_h)) * math.exp(temp_dep * t_h)
+        return (A1 * (strain ** n1)) * (1 + str_rate_dep * np.log(r_h)) * np.exp(temp_dep * t_h)
 
     def derivatives(self, strain: float, strain_rate: float, temperature: float):
         parameters = self.params
@@ -59,20 +57,20 @@ class ModifiedJohnsonCookModel(MaterialModel):
         L1 = parameters[5]
         L2 = parameters[6]
 
-        s_safe = max(strain, 1e-9)
-        sr_safe = max(r_h, 1e-9)
+        s_safe = np.maximum(strain, 1e-9)
+        sr_safe = np.maximum(r_h, 1e-9)
 
         str_rate_dep = b1 + strain * (b2 + strain * b3)
         temp_dep = L1 + L2 * strain
         base_stress = (A1 * (strain ** n1))
-        rate_dependent = (1 + str_rate_dep * math.log(r_h))
-        thermal_dependent = math.exp(temp_dep * t_h)
-        base_rate_component_derivative = base_stress * math.log(sr_safe) * thermal_dependent
+        rate_dependent = (1 + str_rate_dep * np.log(r_h))
+        thermal_dependent = np.exp(temp_dep * t_h)
+        base_rate_component_derivative = base_stress * np.log(sr_safe) * thermal_dependent
         base_thermal_component_derivative = base_stress * rate_dependent * thermal_dependent * t_h
 
         derivatives = {
             labels[0]: (strain ** n1) * rate_dependent * thermal_dependent,
-            labels[1]: math.log(s_safe) * base_stress * rate_dependent * thermal_dependent,
+            labels[1]: np.log(s_safe) * base_stress * rate_dependent * thermal_dependent,
             labels[2]: base_rate_component_derivative,
             labels[3]: base_rate_component_derivative * strain,
             labels[4]: base_rate_component_derivative * (strain ** 2.0),
@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 
 from src.models.material_model import MaterialModel
@@ -32,5 +30,5 @@ class ZerilliArmstrongBCCModel(MaterialModel):
         n = parameters[4]
         C6 = parameters[5]
 
-        exponent = -C3 + C4 * math.log(r_h)
-        return C1 * math.exp(temperature * exponent) + C6 + C5 * strain ** n
\ No newline at end of file
+        exponent = -C3 + C4 * np.log(r_h)
+        return C1 * np.exp(temperature * exponent) + C6 + C5 * strain ** n
\ No newline at end of file
@@ -1,5 +1,3 @@
-import math
-
 import numpy as np
 
 from src.models.material_model import MaterialModel
@@ -30,5 +28,5 @@ class ZerilliArmstrongFCCModel(MaterialModel):
         C4 = parameters[2]
         C6 = parameters[3]
 
-        exponent = -C3 + C4 * math.log(r_h)
-        return C2 * (strain ** 0.5) * math.exp(temperature * exponent) + C6
\ No newline at end of file
+        exponent = -C3 + C4 * np.log(r_h)
+        return C2 * (strain ** 0.5) * np.exp(temperature * exponent) + C6
\ No newline at end of file
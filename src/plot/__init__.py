@@ -4,32 +4,18 @@ import pandas as pd
 
 from matplotlib.offsetbox import AnchoredText
 
-from src.models.johnson_cook_model import JohnsonCookModel
-from src.models.khan_huang_liang_model import KhanHuangLiangModel
-
+from src.config import get_model_name
 from src.models.material_model import MaterialModel
-from src.models.modified_johnson_cook_model import ModifiedJohnsonCookModel
-from src.models.zerilli_armstrong_bcc_model import ZerilliArmstrongBCCModel
-from src.models.zerilli_armstrong_fcc_model import ZerilliArmstrongFCCModel
 
 
 class Plotter:
     pass
 
 
-labels = {
-    JohnsonCookModel: "JC model to data fitness",
-    ModifiedJohnsonCookModel: "MJC model to data fitness",
-    KhanHuangLiangModel: "KHL model to data fitness",
-    ZerilliArmstrongBCCModel: "ZA-BCC model to data fitness",
-    ZerilliArmstrongFCCModel: "ZA-FCC model to data fitness"
-}
-
-
 def plot(df: pd.DataFrame, model: MaterialModel, filename: str):
     dfc = df.copy()
     dfc = dfc.sort_values(by="strain")
-    cls = model.__class__
+    title = '{} model to data fitness'.format(get_model_name(model.__class__))
 
     dfc_c = dfc.copy()
     dfc_c['stress'] = np.nan
@@ -59,7 +45,7 @@ def plot(df: pd.DataFrame, model: MaterialModel, filename: str):
         ax.set_visible(True)
         grouped_c.get_group(key).plot(x='strain', y='comp_stress', c='red', ax=ax, label='Model')
         grouped.get_group(key).plot(x='strain', y='stress', ax=ax, label='Experiment')
-        ax.set_title(labels[cls])
+        ax.set_title(title)
         ax.set_xlabel('True strain')
         ax.set_ylabel('True stress [MPa]')
 
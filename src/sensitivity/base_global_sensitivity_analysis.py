@@ -0,0 +1,159 @@
+import abc
+from concurrent.futures import Executor
+from typing import Type
+
+import numpy as np
+from pandas import DataFrame
+
+from src.models.material_model import MaterialModel
+from src.utils.goal_function import DEFAULT_LOSS
+from src.utils.loss_functions import LossFunction
+
+
+def _evaluate_batch(goal_function: callable,
+                    samples: np.ndarray,
+                    data: DataFrame,
+                    model: Type[MaterialModel],
+                    loss: LossFunction,
+                    weights: np.ndarray):
+    return np.array([goal_function(sample, data, model, loss, weights) for sample in samples], dtype=float)
+
+
+class BaseGlobalSensitivityAnalysis(abc.ABC):
+
+    def __init__(self,
+                 parameters: np.ndarray,
+                 model: Type[MaterialModel],
+                 max_deviation: np.ndarray,
+                 samples: int = 100,
+                 relative_deviations: bool = True,
+                 loss: LossFunction = DEFAULT_LOSS,
+                 weights: np.ndarray = None,
+                 resamples: int = 1000,
+                 confidence_level: float = 0.95,
+                 batch_size: int = 1000,
+                 seed: int = None):
+        if parameters.shape != model.params_scaling().shape:
+            raise ValueError("parameters' shape must match that of model's parameters")
+
+        if samples < 2:
+            raise ValueError("samples must be at least 2")
+
+        if max_deviation.shape != model.params_scaling().shape:
+            raise ValueError("max_deviation's shape must match that of model's parameters")
+
+        if max_deviation.min() <= 0.0:
+            raise ValueError("max_deviation must consist of positive values")
+
+        if resamples < 1:
+            raise ValueError("resamples must be positive value")
+
+        if not 0.0 < confidence_level < 1.0:
+            raise ValueError("confidence_level must be within (0, 1) range")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive value")
+
+        if relative_deviations and np.abs(parameters).min() == 0.0:
+            raise ValueError("relative_deviations cannot be set to True if any of the parameters is zero")
+
+        if not model(parameters).is_within_bounds():
+            raise ValueError("parameters must be within model's bounds")
+
+        self._parameters = parameters
+        self._model = model
+        self._samples = samples
+
+        deviation = max_deviation * np.abs(parameters) if relative_deviations else max_deviation
+        scaling = model.params_scaling()
+        lower_bounds, upper_bounds = model.bounds()
+        self._lower = np.maximum(parameters - deviation, lower_bounds / scaling)
+        self._upper = np.minimum(parameters + deviation, upper_bounds / scaling)
+        if (self._lower >= self._upper).any():
+            raise ValueError("sampling box must have positive width along every parameter's axis")
+
+        self._loss = loss
+        self._weights = weights
+
+        self._resamples = resamples
+        self._confidence_level = confidence_level
+        self._batch_size = batch_size
+        self._rng = np.random.default_rng(seed)
+
+        self._completed = False
+
+        self._incomplete_analysis_error = "Analysis has not been carried out yet"
+        self._results = DataFrame(columns=["Parameter"] + self._result_columns())
+
+    @property
+    def completed(self):
+        return self._completed
+
+    @property
+    def results(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._results
+
+    def run(self, goal_function: callable, data: DataFrame, executor: Executor = None):
+        if self.completed:
+            raise RuntimeError("Analysis is already completed")
+
+        unit_samples = self._get_unit_samples()
+        samples = self._lower + unit_samples * (self._upper - self._lower)
+        errors = self._evaluate(goal_function, samples, data, executor)
+
+        indices = self._get_indices(unit_samples, errors)
+        self._results = DataFrame(dict([("Parameter", self._model.labels())] + list(indices.items())))
+        self._completed = True
+
+    def plot(self, filename: str):
+        if not self.completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+
+        import matplotlib.pyplot as plt
+
+        model = self._model(self._parameters)
+
+        class_name = self._model.__name__
+        params = model.json
+        params_str = ", ".join([f"{k} = {round(v, 4)}" for k, v in params.items()])
+
+        fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 5), facecolor="1.0")
+        fig.suptitle(f"Solution for {class_name}\n({params_str})", fontsize=12)
+
+        self._plot_indices(axes)
+
+        plt.subplots_adjust(wspace=0.35, top=0.8)
+        plt.savefig(filename, dpi=90)
+        plt.close(fig)
+
+    def _evaluate(self, goal_function: callable, samples: np.ndarray, data: DataFrame, executor: Executor = None):
+        batches = [samples[i:i + self._batch_size] for i in range(0, samples.shape[0], self._batch_size)]
+        if executor is None:
+            return np.concatenate([_evaluate_batch(goal_function, batch, data, self._model, self._loss, self._weights)
+                                   for batch in batches])
+        futures = [executor.submit(_evaluate_batch, goal_function, batch, data, self._model, self._loss, self._weights)
+                   for batch in batches]
+        return np.concatenate([future.result() for future in futures])
+
+    def _confidence_interval(self, resampled: np.ndarray):
+        alpha = 100.0 * (1.0 - self._confidence_level) / 2.0
+        lower, upper = np.nanpercentile(resampled, [alpha, 100.0 - alpha], axis=0)
+        return (upper - lower) / 2.0
+
+    @abc.abstractmethod
+    def _result_columns(self):
+        pass
+
+    @abc.abstractmethod
+    def _get_unit_samples(self):
+        pass
+
+    @abc.abstractmethod
+    def _get_indices(self, unit_samples: np.ndarray, errors: np.ndarray):
+        pass
+
+    @abc.abstractmethod
+    def _plot_indices(self, axes):
+        pass
@@ -1,9 +1,7 @@
 import abc
 from typing import Type
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.ticker import FormatStrFormatter
 from pandas import DataFrame
 
 from src.models.material_model import MaterialModel
@@ -126,6 +124,8 @@ class BaseSensitivityAnalysis(abc.ABC):
         if not self.completed:
             raise RuntimeError(self._incomplete_analysis_error)
 
+        import matplotlib.pyplot as plt
+
         grouped = self._results.groupby("Parameter")
         model = self._model(self._parameters)
 
@@ -0,0 +1,178 @@
+from typing import Type
+
+import numpy as np
+from pandas import DataFrame
+
+from src.models.material_model import MaterialModel
+from src.utils.goal_function import DEFAULT_LOSS, residuals_jacobian
+from src.utils.loss_functions import LossFunction
+
+
+class HessianSensitivityAnalysis:
+    """Local counterpart of BaseSensitivityAnalysis; results are in normalised (unscaled) parameter space."""
+
+    def __init__(self,
+                 parameters: np.ndarray,
+                 model: Type[MaterialModel],
+                 loss: LossFunction = DEFAULT_LOSS,
+                 weights: np.ndarray = None,
+                 minimum_eigenvalue_ratio: float = 1e-8):
+        if parameters.shape != model.params_scaling().shape:
+            raise ValueError("parameters' shape must match that of model's parameters")
+
+        if minimum_eigenvalue_ratio <= 0.0:
+            raise ValueError("minimum_eigenvalue_ratio must be positive value")
+
+        self._parameters = parameters
+        self._model = model
+        self._loss = loss
+        self._weights = weights
+        self._minimum_eigenvalue_ratio = minimum_eigenvalue_ratio
+
+        self._completed = False
+
+        self._reference_error = None
+        self._gradient = None
+        self._hessian = None
+        self._eigenvalues = None
+        self._eigenvectors = None
+        self._correlations = None
+
+        self._incomplete_analysis_error = "Analysis has not been carried out yet"
+        self._results = DataFrame(columns=["Parameter", "Gradient", "Curvature", "Identifiable"])
+
+    @property
+    def completed(self):
+        return self._completed
+
+    @property
+    def reference_error(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._reference_error
+
+    @property
+    def gradient(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._gradient
+
+    @property
+    def hessian(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._hessian
+
+    @property
+    def eigenvalues(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._eigenvalues
+
+    @property
+    def eigenvectors(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._eigenvectors
+
+    @property
+    def condition_number(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        if self._eigenvalues[0] <= 0.0:
+            return np.inf
+        return self._eigenvalues[-1] / self._eigenvalues[0]
+
+    @property
+    def correlations(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return DataFrame(self._correlations, index=self._model.labels(), columns=self._model.labels())
+
+    @property
+    def identifiable(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return dict(zip(self._results["Parameter"], self._results["Identifiable"]))
+
+    @property
+    def results(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._results
+
+    def run(self, goal_function: callable, data: DataFrame):
+        if self.completed:
+            raise RuntimeError("Analysis is already completed")
+
+        if not self._model(self._parameters).is_within_bounds():
+            raise ValueError("parameters must be within model's bounds")
+
+        self._reference_error = goal_function(self._parameters, data, self._model, self._loss, self._weights)
+        if not np.isfinite(self._reference_error):
+            raise ValueError("goal function must be finite at parameters")
+
+        with np.errstate(all='ignore'):
+            residuals, jacobian = residuals_jacobian(self._parameters, data, self._model, self._loss.relative)
+        if not (np.isfinite(residuals).all() and np.isfinite(jacobian).all()):
+            raise ValueError("residuals and their derivatives must be finite at parameters")
+
+        if not np.isclose(self._reference_error, self._loss(residuals, self._weights), rtol=1e-9, atol=0.0):
+            raise ValueError("goal_function must evaluate the analysis' loss on residuals of the model")
+
+        hessian_weights = self._loss.hessian_weights(residuals, self._weights)
+
+        self._gradient = self._loss.gradient(residuals, self._weights) @ jacobian
+        self._hessian = jacobian.T @ (hessian_weights[:, np.newaxis] * jacobian)
+        self._eigenvalues, self._eigenvectors = np.linalg.eigh(self._hessian)
+
+        covariance = np.linalg.pinv(self._hessian, hermitian=True)
+        deviations = np.sqrt(np.abs(np.diag(covariance)))
+        deviations[deviations == 0.0] = np.inf
+        self._correlations = covariance / np.outer(deviations, deviations)
+
+        weak = self._eigenvalues < self._minimum_eigenvalue_ratio * max(self._eigenvalues[-1], 0.0)
+        weak_loadings = np.square(self._eigenvectors[:, weak]).sum(axis=1)
+
+        self._results = DataFrame({
+            "Parameter": self._model.labels(),
+            "Gradient": self._gradient,
+            "Curvature": np.diag(self._hessian),
+            "Identifiable": weak_loadings < 0.5
+        })
+        self._completed = True
+
+    def plot(self, filename: str):
+        if not self.completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+
+        import matplotlib.pyplot as plt
+
+        labels = self._model.labels()
+        model = self._model(self._parameters)
+
+        class_name = self._model.__name__
+        params = model.json
+        params_str = ", ".join([f"{k} = {round(v, 4)}" for k, v in params.items()])
+
+        fig, axes = plt.subplots(nrows=1, ncols=2, figsize=(12, 5), facecolor="1.0")
+        fig.suptitle(f"Solution for {class_name}\n({params_str})", fontsize=12)
+
+        eigenvalues_ax, correlations_ax = axes
+        eigenvalues_ax.bar(range(len(self._eigenvalues)), np.abs(self._eigenvalues))
+        eigenvalues_ax.set_yscale("log")
+        eigenvalues_ax.set_title("Gauss-Newton Hessian spectrum")
+        eigenvalues_ax.set_xlabel("Eigenvalue index")
+        eigenvalues_ax.set_ylabel("Eigenvalue magnitude")
+
+        image = correlations_ax.imshow(self._correlations, cmap="coolwarm", vmin=-1.0, vmax=1.0)
+        correlations_ax.set_title("Parameter correlations")
+        correlations_ax.set_xticks(range(len(labels)))
+        correlations_ax.set_xticklabels(labels)
+        correlations_ax.set_yticks(range(len(labels)))
+        correlations_ax.set_yticklabels(labels)
+        fig.colorbar(image, ax=correlations_ax)
+
+        plt.subplots_adjust(wspace=0.35, top=0.8)
+        plt.savefig(filename, dpi=90)
+        plt.close(fig)
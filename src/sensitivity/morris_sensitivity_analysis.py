@@ -0,0 +1,75 @@
+import numpy as np
+
+from src.sensitivity.base_global_sensitivity_analysis import BaseGlobalSensitivityAnalysis
+
+
+class MorrisSensitivityAnalysis(BaseGlobalSensitivityAnalysis):
+
+    def __init__(self, *args, levels: int = 4, **kwargs):
+        if levels < 2:
+            raise ValueError("levels must be at least 2")
+
+        self._levels = levels
+        super().__init__(*args, **kwargs)
+
+    def _result_columns(self):
+        return ["mu", "mu*", "mu* conf", "sigma"]
+
+    def _get_unit_samples(self):
+        trajectories = self._samples
+        dimensions = self._parameters.shape[0]
+        delta = self._levels / (2.0 * (self._levels - 1))
+
+        base = self._rng.integers(0, self._levels, size=(trajectories, dimensions)) / (self._levels - 1)
+        steps = np.where(base + delta <= 1.0, delta, -delta)
+        order = np.argsort(self._rng.random((trajectories, dimensions)), axis=1)
+
+        moves = np.zeros((trajectories, dimensions + 1, dimensions))
+        rows = np.arange(trajectories)[:, np.newaxis]
+        moves[rows, np.arange(1, dimensions + 1), order] = steps[rows, order]
+        points = base[:, np.newaxis, :] + np.cumsum(moves, axis=1)
+
+        self._order = order
+        self._steps = steps
+        return points.reshape(-1, dimensions)
+
+    def _get_indices(self, unit_samples: np.ndarray, errors: np.ndarray):
+        trajectories = self._samples
+        dimensions = self._parameters.shape[0]
+        errors = errors.reshape(trajectories, dimensions + 1)
+
+        rows = np.arange(trajectories)[:, np.newaxis]
+        effects = np.empty((trajectories, dimensions))
+        effects[rows, self._order] = np.diff(errors, axis=1) / self._steps[rows, self._order]
+        effects = effects[np.isfinite(effects).all(axis=1)]
+        if effects.shape[0] < 2:
+            raise RuntimeError("Not enough trajectories with finite goal function values")
+
+        resampled = effects[self._rng.integers(0, effects.shape[0], size=(self._resamples, effects.shape[0]))]
+
+        return {
+            "mu": effects.mean(axis=0),
+            "mu*": np.abs(effects).mean(axis=0),
+            "mu* conf": self._confidence_interval(np.abs(resampled).mean(axis=1)),
+            "sigma": effects.std(axis=0, ddof=1)
+        }
+
+    def _plot_indices(self, axes):
+        labels = self._results["Parameter"]
+        positions = np.arange(len(labels))
+
+        mu_star_ax, sigma_ax = axes
+        mu_star_ax.bar(positions, self._results["mu*"], yerr=self._results["mu* conf"], capsize=4)
+        mu_star_ax.set_xticks(positions)
+        mu_star_ax.set_xticklabels(labels)
+        mu_star_ax.set_title("Morris screening")
+        mu_star_ax.set_ylabel("mu*")
+        mu_star_ax.ticklabel_format(axis='y', style='sci', scilimits=(0, 0))
+
+        sigma_ax.scatter(self._results["mu*"], self._results["sigma"])
+        for label, mu_star, sigma in zip(labels, self._results["mu*"], self._results["sigma"]):
+            sigma_ax.annotate(label, (mu_star, sigma))
+        sigma_ax.set_title("Non-linearity and interactions")
+        sigma_ax.set_xlabel("mu*")
+        sigma_ax.set_ylabel("sigma")
+        sigma_ax.ticklabel_format(axis='both', style='sci', scilimits=(0, 0))
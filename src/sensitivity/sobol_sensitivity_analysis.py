@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.sensitivity.base_global_sensitivity_analysis import BaseGlobalSensitivityAnalysis
+
+
+class SobolSensitivityAnalysis(BaseGlobalSensitivityAnalysis):
+
+    def _result_columns(self):
+        return ["S1", "S1 conf", "ST", "ST conf"]
+
+    def _get_unit_samples(self):
+        samples = self._samples
+        dimensions = self._parameters.shape[0]
+
+        a = self._rng.random((samples, dimensions))
+        b = self._rng.random((samples, dimensions))
+        ab = np.repeat(a[np.newaxis, :, :], dimensions, axis=0)
+        ab[np.arange(dimensions), :, np.arange(dimensions)] = b.T
+
+        return np.concatenate([a, b, ab.reshape(-1, dimensions)])
+
+    def _get_indices(self, unit_samples: np.ndarray, errors: np.ndarray):
+        samples = self._samples
+        dimensions = self._parameters.shape[0]
+
+        f_a = errors[:samples]
+        f_b = errors[samples:2 * samples]
+        f_ab = errors[2 * samples:].reshape(dimensions, samples).T
+
+        finite = np.isfinite(f_a) & np.isfinite(f_b) & np.isfinite(f_ab).all(axis=1)
+        f_a, f_b, f_ab = f_a[finite], f_b[finite], f_ab[finite]
+        if f_a.shape[0] < 2:
+            raise RuntimeError("Not enough samples with finite goal function values")
+
+        first_order, total = self._sobol_indices(f_a, f_b, f_ab)
+
+        resampled = self._rng.integers(0, f_a.shape[0], size=(self._resamples, f_a.shape[0]))
+        resampled_first_order, resampled_total = self._sobol_indices(f_a[resampled], f_b[resampled],
+                                                                      f_ab[resampled])
+
+        return {
+            "S1": first_order,
+            "S1 conf": self._confidence_interval(resampled_first_order),
+            "ST": total,
+            "ST conf": self._confidence_interval(resampled_total)
+        }
+
+    @staticmethod
+    def _sobol_indices(f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray):
+        f_a = f_a[..., np.newaxis]
+        f_b = f_b[..., np.newaxis]
+        variance = np.concatenate([f_a, f_b], axis=-2).var(axis=-2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            first_order = (f_b * (f_ab - f_a)).mean(axis=-2) / variance
+            total = 0.5 * np.square(f_a - f_ab).mean(axis=-2) / variance
+        return first_order, total
+
+    def _plot_indices(self, axes):
+        labels = self._results["Parameter"]
+        positions = np.arange(len(labels))
+        width = 0.4
+
+        indices_ax, total_ax = axes
+        indices_ax.bar(positions - width / 2, self._results["S1"], width, yerr=self._results["S1 conf"],
+                       capsize=4, label="S1")
+        indices_ax.bar(positions + width / 2, self._results["ST"], width, yerr=self._results["ST conf"],
+                       capsize=4, label="ST")
+        indices_ax.set_xticks(positions)
+        indices_ax.set_xticklabels(labels)
+        indices_ax.set_title("Sobol indices")
+        indices_ax.set_ylabel("Sensitivity index")
+        indices_ax.legend(loc='upper right', framealpha=0.85, edgecolor='black', fancybox=False)
+
+        interactions = self._results["ST"] - self._results["S1"]
+        total_ax.bar(positions, interactions)
+        total_ax.set_xticks(positions)
+        total_ax.set_xticklabels(labels)
+        total_ax.set_title("Interaction effects")
+        total_ax.set_ylabel("ST - S1")
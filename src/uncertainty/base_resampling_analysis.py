@@ -0,0 +1,184 @@
+import abc
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Type
+
+import numpy as np
+from pandas import DataFrame
+
+from src.config import GRADIENT_METHODS
+from src.models.material_model import MaterialModel
+from src.utils.goal_function import DEFAULT_LOSS, goal_function, goal_function_gradient
+from src.utils.loss_functions import LossFunction
+
+
+def _refit(parameters: np.ndarray,
+           replicate_weights: np.ndarray,
+           data: DataFrame,
+           model: Type[MaterialModel],
+           method: str,
+           loss: LossFunction,
+           tol: float):
+    import scipy.optimize as scopt
+
+    results = []
+    for weights in replicate_weights:
+        result = scopt.minimize(
+            fun=goal_function,
+            x0=parameters,
+            args=(data, model, loss, weights),
+            method=method,
+            jac=goal_function_gradient if method in GRADIENT_METHODS else None,
+            tol=tol
+        )
+        results.append((result.x, result.fun, bool(result.success)))
+    return results
+
+
+class BaseResamplingAnalysis(abc.ABC):
+
+    def __init__(self,
+                 parameters: np.ndarray,
+                 model: Type[MaterialModel],
+                 method: str = 'Nelder-Mead',
+                 by_group: bool = False,
+                 loss: LossFunction = DEFAULT_LOSS,
+                 weights: np.ndarray = None,
+                 chunk_size: int = 10,
+                 tol: float = 1e-8):
+        if parameters.shape != model.params_scaling().shape:
+            raise ValueError("parameters' shape must match that of model's parameters")
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive value")
+
+        if tol <= 0.0:
+            raise ValueError("tol must be positive value")
+
+        self._parameters = parameters
+        self._model = model
+        self._method = method
+        self._by_group = by_group
+        self._loss = loss
+        self._weights = weights
+        self._chunk_size = chunk_size
+        self._tol = tol
+
+        self._completed = False
+
+        self._incomplete_analysis_error = "Analysis has not been carried out yet"
+        self._results = DataFrame(columns=["Replicate", "Fitness", "Success"] + model.labels())
+
+    @property
+    def completed(self):
+        return self._completed
+
+    @property
+    def estimate(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._parameters
+
+    @property
+    def dropped_replicates(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return int((~self._valid_replicates()).sum())
+
+    @property
+    def results(self):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+        return self._results
+
+    def confidence_intervals(self, level: float = 0.95):
+        if not self._completed:
+            raise RuntimeError(self._incomplete_analysis_error)
+
+        if not 0.0 < level < 1.0:
+            raise ValueError("level must be within (0, 1) range")
+
+        valid = self._results[self._valid_replicates()]
+        if len(valid) < 2:
+            raise RuntimeError("Not enough converged replicates to estimate confidence intervals")
+        samples = valid[self._model.labels()].to_numpy(dtype=float)
+        estimate = self._model(self._parameters).params
+        lower, upper = self._get_interval(samples, estimate, level)
+        return dict((label, (float(low), float(high))) for label, low, high in zip(self._model.labels(), lower, upper))
+
+    def run(self, data: DataFrame, executor: Executor = None, filename: str = None):
+        if self.completed:
+            raise RuntimeError("Analysis is already completed")
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor()
+
+        labels = self._model.labels()
+        scaling = self._model.params_scaling()
+        base_weights = np.ones(len(data)) if self._weights is None else self._weights
+        groups = data.groupby(['strain_rate', 'temperature']).ngroup().to_numpy() if self._by_group else None
+
+        parameters, fitness, _ = _refit(self._parameters, base_weights[np.newaxis, :], data, self._model,
+                                        self._method, self._loss, self._tol)[0]
+        if fitness <= goal_function(self._parameters, data, self._model, self._loss, base_weights):
+            self._parameters = parameters
+
+        futures = {}
+        chunk = []
+        first_replicate = 0
+        for replicate, counts in enumerate(self._get_replicate_counts(len(data), groups)):
+            chunk.append(base_weights * counts)
+            if len(chunk) == self._chunk_size:
+                futures[self._submit(executor, chunk, data)] = first_replicate
+                chunk = []
+                first_replicate = replicate + 1
+        if chunk:
+            futures[self._submit(executor, chunk, data)] = first_replicate
+
+        rows = []
+        output = open(filename, 'w') if filename is not None else None
+        try:
+            if output is not None:
+                output.write(",".join(["Replicate", "Fitness", "Success"] + labels) + "\n")
+            for future in as_completed(futures):
+                for offset, (parameters, fitness, success) in enumerate(future.result()):
+                    row = [futures[future] + offset, fitness, success] + list(parameters * scaling)
+                    rows.append(row)
+                    if output is not None:
+                        output.write(",".join(str(value) for value in row) + "\n")
+                if output is not None:
+                    output.flush()
+        finally:
+            if output is not None:
+                output.close()
+            if own_executor:
+                executor.shutdown()
+
+        self._results = DataFrame(rows, columns=["Replicate", "Fitness", "Success"] + labels)
+        self._results.sort_values(by="Replicate", inplace=True)
+        self._results.reset_index(drop=True, inplace=True)
+        self._completed = True
+
+    def _valid_replicates(self):
+        finite = np.isfinite(self._results["Fitness"].to_numpy(dtype=float))
+        converged = self._results["Success"].to_numpy(dtype=bool)
+        return finite & converged
+
+    def _submit(self, executor: Executor, chunk: list, data: DataFrame):
+        return executor.submit(_refit, self._parameters, np.array(chunk), data, self._model, self._method,
+                               self._loss, self._tol)
+
+    def _get_replicate_counts(self, points: int, groups: np.ndarray = None):
+        if groups is None:
+            yield from self._get_resampling_counts(points)
+        else:
+            for counts in self._get_resampling_counts(groups.max() + 1):
+                yield counts[groups]
+
+    @abc.abstractmethod
+    def _get_resampling_counts(self, size: int):
+        pass
+
+    @abc.abstractmethod
+    def _get_interval(self, samples: np.ndarray, estimate: np.ndarray, level: float):
+        pass
@@ -0,0 +1,32 @@
+from typing import Type
+
+import numpy as np
+
+from src.models.material_model import MaterialModel
+from src.uncertainty.base_resampling_analysis import BaseResamplingAnalysis
+
+
+class BootstrapAnalysis(BaseResamplingAnalysis):
+
+    def __init__(self,
+                 parameters: np.ndarray,
+                 model: Type[MaterialModel],
+                 replicates: int = 1000,
+                 seed: int = None,
+                 **kwargs):
+        if replicates < 2:
+            raise ValueError("replicates must be at least 2")
+
+        super().__init__(parameters, model, **kwargs)
+        self._replicates = replicates
+        self._seed = seed
+
+    def _get_resampling_counts(self, size: int):
+        rng = np.random.default_rng(self._seed)
+        probabilities = np.full(size, 1.0 / size)
+        for _ in range(self._replicates):
+            yield rng.multinomial(size, probabilities)
+
+    def _get_interval(self, samples: np.ndarray, estimate: np.ndarray, level: float):
+        alpha = 100.0 * (1.0 - level) / 2.0
+        return np.percentile(samples, alpha, axis=0), np.percentile(samples, 100.0 - alpha, axis=0)
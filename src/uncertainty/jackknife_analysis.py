@@ -0,0 +1,21 @@
+from statistics import NormalDist
+
+import numpy as np
+
+from src.uncertainty.base_resampling_analysis import BaseResamplingAnalysis
+
+
+class JackknifeAnalysis(BaseResamplingAnalysis):
+
+    def _get_resampling_counts(self, size: int):
+        for index in range(size):
+            counts = np.ones(size)
+            counts[index] = 0.0
+            yield counts
+
+    def _get_interval(self, samples: np.ndarray, estimate: np.ndarray, level: float):
+        replicates = samples.shape[0]
+        deviation = samples - samples.mean(axis=0)
+        standard_error = np.sqrt((replicates - 1) / replicates * np.square(deviation).sum(axis=0))
+        z = NormalDist().inv_cdf(0.5 + level / 2.0)
+        return estimate - z * standard_error, estimate + z * standard_error
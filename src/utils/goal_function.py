@@ -5,18 +5,73 @@ import numpy as np
 import pandas as pd
 
 from src.models.material_model import MaterialModel
+from src.utils.loss_functions import LossFunction, SquaredLoss
 
+DEFAULT_LOSS = SquaredLoss(relative=True)
 
-def goal_function(parameters: np.ndarray, data_frame: pd.DataFrame, material_model_class: Type[MaterialModel]):
+
+def condition_weights(data_frame: pd.DataFrame):
+    group_sizes = data_frame.groupby(['strain_rate', 'temperature'])['stress'].transform('size').to_numpy()
+    groups = data_frame.groupby(['strain_rate', 'temperature']).ngroups
+    return 1.0 / (groups * group_sizes)
+
+
+def _columns(data_frame: pd.DataFrame):
+    return (data_frame['strain'].to_numpy(),
+            data_frame['strain_rate'].to_numpy(),
+            data_frame['temperature'].to_numpy(),
+            data_frame['stress'].to_numpy())
+
+
+def _residuals(model: MaterialModel, strain, strain_rate, temperature, stress, relative: bool):
+    residuals = model(strain, strain_rate, temperature) - stress
+    if relative:
+        residuals /= stress
+    return residuals
+
+
+def goal_function(parameters: np.ndarray,
+                  data_frame: pd.DataFrame,
+                  material_model_class: Type[MaterialModel],
+                  loss: LossFunction = DEFAULT_LOSS,
+                  weights: np.ndarray = None):
     try:
         model = material_model_class(parameters)
         if not model.is_within_bounds():
             return math.inf
-        data_frame = data_frame.copy(deep=True)
-        data_frame['comp_stress'] = data_frame.apply(
-            lambda row: model(row['strain'], row['strain_rate'], row['temperature']),
-            axis=1)
-        data_frame['error'] = ((data_frame['comp_stress'] - data_frame['stress']) / data_frame['stress']) ** 2
-        return data_frame['error'].mean()
+        strain, strain_rate, temperature, stress = _columns(data_frame)
+        with np.errstate(all='ignore'):
+            residuals = _residuals(model, strain, strain_rate, temperature, stress, loss.relative)
+            error = loss(residuals, weights)
+        return error if np.isfinite(error) else math.inf
     except OverflowError:
         return math.inf
+
+
+def residuals_jacobian(parameters: np.ndarray,
+                       data_frame: pd.DataFrame,
+                       material_model_class: Type[MaterialModel],
+                       relative: bool = True):
+    model = material_model_class(parameters)
+    strain, strain_rate, temperature, stress = _columns(data_frame)
+    residuals = _residuals(model, strain, strain_rate, temperature, stress, relative)
+    jacobian = model.jacobian(strain, strain_rate, temperature) * material_model_class.params_scaling()
+    if relative:
+        jacobian /= stress[:, np.newaxis]
+    return residuals, jacobian
+
+
+def goal_function_gradient(parameters: np.ndarray,
+                           data_frame: pd.DataFrame,
+                           material_model_class: Type[MaterialModel],
+                           loss: LossFunction = DEFAULT_LOSS,
+                           weights: np.ndarray = None):
+    try:
+        if not material_model_class(parameters).is_within_bounds():
+            return np.full(parameters.shape, np.nan)
+        with np.errstate(all='ignore'):
+            residuals, jacobian = residuals_jacobian(parameters, data_frame, material_model_class, loss.relative)
+            gradient = loss.gradient(residuals, weights) @ jacobian
+        return gradient if np.isfinite(gradient).all() else np.full(parameters.shape, np.nan)
+    except OverflowError:
+        return np.full(parameters.shape, np.nan)
@@ -0,0 +1,127 @@
+import abc
+
+import numpy as np
+
+
+class LossFunction(abc.ABC):
+
+    def __init__(self, relative: bool = True, scale: float = 1.0):
+        if scale <= 0.0:
+            raise ValueError("scale must be positive value")
+        self._relative = relative
+        self._scale = scale
+
+    @property
+    def relative(self):
+        return self._relative
+
+    @property
+    def scale(self):
+        return self._scale
+
+    def __call__(self, residuals: np.ndarray, weights: np.ndarray = None):
+        z = np.divide(residuals, self._scale)
+        np.square(z, out=z)
+        self._rho(z)
+        return self._scale ** 2 * self._reduce(z, weights)
+
+    def gradient(self, residuals: np.ndarray, weights: np.ndarray = None):
+        z = np.divide(residuals, self._scale)
+        np.square(z, out=z)
+        self._rho_derivative(z)
+        z *= residuals
+        return self._normalize(z, weights)
+
+    def hessian_weights(self, residuals: np.ndarray, weights: np.ndarray = None):
+        z = np.divide(residuals, self._scale)
+        np.square(z, out=z)
+        self._rho_curvature(z)
+        np.maximum(z, 0.0, out=z)
+        return self._normalize(z, weights)
+
+    @staticmethod
+    def _normalize(values: np.ndarray, weights: np.ndarray):
+        values *= 2.0
+        if weights is None:
+            values /= values.shape[0]
+        else:
+            values *= weights
+            values /= weights.sum()
+        return values
+
+    @staticmethod
+    def _reduce(values: np.ndarray, weights: np.ndarray):
+        if weights is None:
+            return values.mean()
+        return np.dot(weights, values) / weights.sum()
+
+    @abc.abstractmethod
+    def _rho(self, z: np.ndarray):
+        pass
+
+    @abc.abstractmethod
+    def _rho_derivative(self, z: np.ndarray):
+        pass
+
+    @abc.abstractmethod
+    def _rho_curvature(self, z: np.ndarray):
+        pass
+
+
+class SquaredLoss(LossFunction):
+
+    def _rho(self, z: np.ndarray):
+        pass
+
+    def _rho_derivative(self, z: np.ndarray):
+        z.fill(1.0)
+
+    def _rho_curvature(self, z: np.ndarray):
+        z.fill(1.0)
+
+
+class HuberLoss(LossFunction):
+
+    def _rho(self, z: np.ndarray):
+        outliers = z > 1.0
+        z[outliers] = 2.0 * np.sqrt(z[outliers]) - 1.0
+
+    def _rho_derivative(self, z: np.ndarray):
+        outliers = z > 1.0
+        z[outliers] = 1.0 / np.sqrt(z[outliers])
+        z[~outliers] = 1.0
+
+    def _rho_curvature(self, z: np.ndarray):
+        outliers = z > 1.0
+        z[outliers] = 0.0
+        z[~outliers] = 1.0
+
+
+class CauchyLoss(LossFunction):
+
+    def _rho(self, z: np.ndarray):
+        np.log1p(z, out=z)
+
+    def _rho_derivative(self, z: np.ndarray):
+        z += 1.0
+        np.reciprocal(z, out=z)
+
+    def _rho_curvature(self, z: np.ndarray):
+        denominator = np.square(z + 1.0)
+        np.negative(z, out=z)
+        z += 1.0
+        z /= denominator
+
+
+_loss_factories = {
+    'relative-L2': lambda scale: SquaredLoss(relative=True),
+    'absolute-L2': lambda scale: SquaredLoss(relative=False),
+    'huber': lambda scale: HuberLoss(relative=True, scale=scale),
+    'cauchy': lambda scale: CauchyLoss(relative=True, scale=scale)
+}
+
+
+def get_loss(name: str, scale: float = 0.05):
+    if name not in _loss_factories:
+        raise ValueError("Unknown loss function: {}".format(name))
+    return _loss_factories[name](scale)